@@ -1,7 +1,6 @@
-import os
 import pandas as pd
 import numpy as np
-import random
+from scipy.optimize import brentq
 
 def calculate_representative_cell_length(file_location):
     r"""Reads a csv with volume data entries for every cell in a CFD-mesh to 
@@ -25,19 +24,23 @@ def calculate_representative_cell_length(file_location):
 
     """
 
-    df = pd.read_table(file_location, header=None,
-                               names=["cellvolume"])
+    # Only sum and count are needed, so read the file in chunks to keep
+    # memory bounded for very large meshes
+    CHUNKSIZE = 1000000
+    total_cellvolume = 0.0
+    n_cells = 0
+    for chunk in pd.read_csv(file_location, header=None, dtype=np.float64,
+                             engine="c", chunksize=CHUNKSIZE):
+        cellvolume = chunk.iloc[:, 0].values
+        total_cellvolume += cellvolume.sum()
+        n_cells += cellvolume.size
 
     # Equation (1) in [1]
-    total_cellvolume = df["cellvolume"].sum()
-    n_cells = len(df.index)
     representative_cell_length = (1 / n_cells * total_cellvolume)** (1./3.)
 
     return representative_cell_length
 
 
-print(calculate_representative_cell_length("C:/temp/volumedata.csv"))
-
 def calculate_discretization_error(phi_1, phi_2, phi_3, file_location1,
                                    file_location2, file_location3):
     r"""Calculates fine-grid convergence index, extrapolated relative error,
@@ -92,19 +95,22 @@ def calculate_discretization_error(phi_1, phi_2, phi_3, file_location1,
     s = np.sign(epsilon_32 / epsilon_21)
 
     # Find order of convergence p, Combine (3a) and (3b) in [1]
-    N_POINTS = 10000
-
-    for i in range(1, N_POINTS):
-        p_i = random.uniform(1, 2)
-        residual = 1 / np.log(r21) * np.abs(np.log(np.abs(epsilon_32 
-                   / epsilon_21)) + np.log((r_21**p_i - s) 
-                   / (r_32 ** p_i - s)))  - p_i
-        if (residual < residual_min):
-            residual_min  = residual
-            p = p_i
+    def residual(p_i):
+        return 1 / np.log(r21) * np.abs(np.log(np.abs(epsilon_32
+               / epsilon_21)) + np.log((r21 ** p_i - s)
+               / (r32 ** p_i - s))) - p_i
+
+    try:
+        p = brentq(residual, 1.0, 2.0, xtol=1e-10)
+    except ValueError:
+        # No sign change in [1, 2]: use the point of a deterministic grid
+        # with the smallest residual
+        p_grid = np.linspace(1, 2, 128)
+        p = p_grid[np.argmin(np.abs(residual(p_grid)))]
+        print("No order of convergence in [1, 2], using p =", p)
 
     # Calculate the extrapolated value
-    phi_21_extrapolated = (r_21 ** p * phi_1 - phi_2) / (r_21 ** p - 1)
+    phi_21_extrapolated = (r21 ** p * phi_1 - phi_2) / (r21 ** p - 1)
 
     # Calculate the approximate relative error
     e_a_21 = np.abs((phi_1 - phi_2) / phi_1)
@@ -113,9 +119,8 @@ def calculate_discretization_error(phi_1, phi_2, phi_3, file_location1,
     e_ext_21 = np.abs((phi_21_extrapolated - phi_1) / phi_21_extrapolated)
 
     #Calculate the fine grid convergence index
-    gci_fine_21 = (1.25 * e_a_21) / (r_21 ** p - 1)
-
-
-
+    gci_fine_21 = (1.25 * e_a_21) / (r21 ** p - 1)
 
 
+if __name__ == "__main__":
+    print(calculate_representative_cell_length("C:/temp/volumedata.csv"))
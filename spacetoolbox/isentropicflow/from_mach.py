@@ -1,3 +1,6 @@
+from .helper import ratio_constants
+
+
 def pressure_to_pressure_total(mach, gamma):
     r"""Calculates the pressure ratio given the mach number Ma.
 
@@ -5,15 +8,19 @@ def pressure_to_pressure_total(mach, gamma):
         \frac{p}{p_{t}} = \left ( 1 + \frac{\gamma -1}{2} M^2 \right )^{\frac{-\gamma}{(\gamma - 1)}}
 
     Args:
-        mach (float): Mach number
+        mach (float or numpy.array): Mach number, arrays are evaluated
+            element-wise
         gamma (float): Specific heat ratio
 
     Returns:
         Pressure ratio
 
     """
-    pressure_to_pressure_total = (1 + ((gamma - 1) / 2) * mach**2) ** (-gamma /
-                                 (gamma - 1))
+    constants = ratio_constants(gamma)
+    half_gamma_minus_one = constants.half_gamma_minus_one
+    exponent_pressure = constants.exponent_pressure
+    pressure_to_pressure_total = (1 / (1 + half_gamma_minus_one * mach
+                                 * mach)) ** exponent_pressure
 
     return pressure_to_pressure_total
 
@@ -25,13 +32,16 @@ def temperature_to_temperature_total(mach, gamma):
         \frac{T}{T_{t}} = \left ( 1 + \frac{\gamma -1}{2} M^2 \right )^{-1}
 
     Args:
-        mach (float): Mach number
+        mach (float or numpy.array): Mach number, arrays are evaluated
+            element-wise
         gamma (float): Specific heat ratio
 
     Returns:
         Temperature ratio
     """
-    temperature_to_temperature_total = (1 + ((gamma - 1) / 2) * mach**2) ** (-1)
+    half_gamma_minus_one = ratio_constants(gamma).half_gamma_minus_one
+    temperature_to_temperature_total = 1 / (1 + half_gamma_minus_one * mach
+                                       * mach)
 
     return temperature_to_temperature_total
 
@@ -44,14 +54,52 @@ def rho_to_rho_total(mach, gamma):
             ^{\frac{-1}{(\gamma - 1)}}
 
     Args:
-        mach (float): Mach number
+        mach (float or numpy.array): Mach number, arrays are evaluated
+            element-wise
         gamma (float): Specific heat ratio
 
     Returns:
         Density ratio
 
     """
-    rho_to_rho_total = (1 + ((gamma - 1) / 2) * mach**2) ** (-1 / (gamma - 1))
+    constants = ratio_constants(gamma)
+    half_gamma_minus_one = constants.half_gamma_minus_one
+    exponent_rho = constants.exponent_rho
+    rho_to_rho_total = (1 / (1 + half_gamma_minus_one * mach
+                       * mach)) ** exponent_rho
 
     return rho_to_rho_total
 
+
+def isentropic_ratios(mach, gamma):
+    r"""Calculates the pressure, temperature and density ratio given the mach
+    number Ma in one pass.
+
+    The common term is evaluated once and the pressure and density ratio
+    are derived from the temperature ratio:
+
+    .. math::
+        \frac{p}{p_{t}} = \left ( \frac{T}{T_{t}} \right )^{\frac{\gamma}{(\gamma - 1)}}, \quad
+        \frac{\rho}{\rho_{t}} = \left ( \frac{T}{T_{t}} \right )^{\frac{1}{(\gamma - 1)}}
+
+    Args:
+        mach (float or numpy.array): Mach number, arrays are evaluated
+            element-wise
+        gamma (float): Specific heat ratio
+
+    Returns:
+        Pressure ratio, temperature ratio and density ratio
+
+    """
+    constants = ratio_constants(gamma)
+    half_gamma_minus_one = constants.half_gamma_minus_one
+    exponent_pressure = constants.exponent_pressure
+    exponent_rho = constants.exponent_rho
+    temperature_to_temperature_total = 1 / (1 + half_gamma_minus_one * mach
+                                       * mach)
+    pressure_to_pressure_total = temperature_to_temperature_total \
+                                 ** exponent_pressure
+    rho_to_rho_total = temperature_to_temperature_total ** exponent_rho
+
+    return (pressure_to_pressure_total, temperature_to_temperature_total,
+            rho_to_rho_total)
@@ -1,3 +1,6 @@
+from .helper import ratio_constants
+
+
 def temperature_to_temperature_total(pressure_to_pressure_total, gamma):
     r"""Calculates the temperature ratio given the mach number Ma.
 
@@ -5,13 +8,15 @@ def temperature_to_temperature_total(pressure_to_pressure_total, gamma):
         \frac{T}{T_{t}} = \left (\frac{p}{p_t}\right)^{\frac{gamma - 1}{gamma}}
 
     Args:
-        pressure_to_pressure_total (float): Pressure ratio
+        pressure_to_pressure_total (float or numpy.array): Pressure ratio,
+            arrays are evaluated element-wise
         gamma (float): Specific heat ratio
 
     Returns:
         Temperature ratio
     """
-    temperature_to_temperature_total = pressure_to_pressure_total ** ((gamma 
-        - 1) / gamma)
+    exponent_temperature = ratio_constants(gamma).exponent_temperature
+    temperature_to_temperature_total = pressure_to_pressure_total \
+                                       ** exponent_temperature
 
     return temperature_to_temperature_total
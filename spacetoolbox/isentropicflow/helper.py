@@ -0,0 +1,62 @@
+import functools
+
+
+class RatioConstants:
+    r"""Constants of the isentropic flow relations for a given specific heat
+    ratio.
+
+    Each constant is computed on first access only, so a relation never
+    evaluates terms it does not use (e.g. :math:`\frac{1}{\gamma - 1}` for
+    the temperature ratio, which stays defined for :math:`\gamma = 1`).
+
+    Args:
+        gamma (float or numpy.array): Specific heat ratio
+
+    """
+
+    def __init__(self, gamma):
+        self.gamma = gamma
+
+    @functools.cached_property
+    def half_gamma_minus_one(self):
+        r""":math:`\frac{\gamma - 1}{2}`"""
+        return (self.gamma - 1) / 2
+
+    @functools.cached_property
+    def exponent_pressure(self):
+        r""":math:`\frac{\gamma}{\gamma - 1}`"""
+        return self.gamma / (self.gamma - 1)
+
+    @functools.cached_property
+    def exponent_rho(self):
+        r""":math:`\frac{1}{\gamma - 1}`"""
+        return 1 / (self.gamma - 1)
+
+    @functools.cached_property
+    def exponent_temperature(self):
+        r""":math:`\frac{\gamma - 1}{\gamma}`"""
+        return (self.gamma - 1) / self.gamma
+
+
+def ratio_constants(gamma):
+    r"""Returns the constants of the isentropic flow relations for a given
+    specific heat ratio.
+
+    The constants are cached per gamma, so sweeps that call the ratio
+    functions repeatedly do not recompute them. Unhashable gammas (e.g.
+    numpy.array) are evaluated element-wise without caching.
+
+    Args:
+        gamma (float or numpy.array): Specific heat ratio
+
+    Returns:
+        :class:`RatioConstants` of gamma
+
+    """
+    try:
+        return _cached_ratio_constants(gamma)
+    except TypeError:
+        return RatioConstants(gamma)
+
+
+_cached_ratio_constants = functools.lru_cache(maxsize=64)(RatioConstants)
@@ -1,6 +1,6 @@
+import functools
 import math
 import numpy as np
-import random
 
 def prandtl_meyer_function_from_angle(prandtl_meyer_angle, gamma):
     r"""Calculates the Mach number given the Prandtl-Meyer angle
@@ -13,18 +13,42 @@ def prandtl_meyer_function_from_angle(prandtl_meyer_angle, gamma):
         Mach number
 
     """
-    N_MACH = 10000
-    minimum = 1
-    for i in range(1, N_MACH  + 1):
-        mach_i = random.uniform(1, 5)
-        prandtl_meyer_angle_radians = prandtl_meyer_angle / 180 * math.pi
-        prandtl_meyer_angle_compare = prandtl_meyer_function_from_mach(mach_i, 
-                                          gamma)
-        delta_prandtl_meyer_angle = abs(prandtl_meyer_angle_radians \
-                                    - prandtl_meyer_angle_compare)
-        if delta_prandtl_meyer_angle < minimum:
-            mach = mach_i
-            minimum = delta_prandtl_meyer_angle
+    prandtl_meyer_angle_radians = math.radians(prandtl_meyer_angle)
+    mach_lower = 1.0
+    mach_upper = 50.0
+    if not 0 <= prandtl_meyer_angle_radians \
+            <= prandtl_meyer_function_from_mach(mach_upper, gamma):
+        raise ValueError("Prandtl-Meyer angle outside of 1 <= M <= 50")
+
+    # Newton iteration, falling back to bisection whenever a step leaves
+    # the bracket (the derivative vanishes at M = 1)
+    N_ITERATIONS = 100
+    half_gamma_minus_one = 0.5 * (gamma - 1)
+    mach = 2.0
+    for i in range(N_ITERATIONS):
+        delta_prandtl_meyer_angle = prandtl_meyer_function_from_mach(mach,
+                                        gamma) - prandtl_meyer_angle_radians
+        if delta_prandtl_meyer_angle == 0:
+            return mach
+        if delta_prandtl_meyer_angle > 0:
+            mach_upper = mach
+        else:
+            mach_lower = mach
+        derivative = math.sqrt(mach * mach - 1) / (mach * (1
+                     + half_gamma_minus_one * mach * mach))
+        if derivative > 0:
+            mach_new = mach - delta_prandtl_meyer_angle / derivative
+            # Converged Newton steps are accepted before the bracket check,
+            # which would otherwise reject a root on the bracket boundary
+            if abs(mach_new - mach) < 1e-12:
+                return mach_new
+        else:
+            mach_new = mach_upper
+        if not mach_lower < mach_new < mach_upper:
+            mach_new = 0.5 * (mach_lower + mach_upper)
+        if abs(mach_new - mach) < 1e-12:
+            return mach_new
+        mach = mach_new
 
     return mach
 
@@ -44,3 +68,65 @@ def prandtl_meyer_function_from_mach(mach, gamma):
         - 1))
 
     return prandtl_meyer_angle
+
+
+def prandtl_meyer_function_from_mach_vec(mach, gamma):
+    r"""Calculates the Prandtl-Meyer angle for an array of Mach numbers
+
+    Args:
+        mach (numpy.array): Mach numbers
+        gamma: Heat capacity ratio
+
+    Returns:
+        Prandtl-Meyer angles in radians
+    """
+    A = math.sqrt((gamma + 1) / (gamma - 1))
+    B = (gamma - 1) / (gamma + 1)
+    mach_squared_minus_one = np.asarray(mach) ** 2 - 1
+    prandtl_meyer_angle = A * np.arctan(np.sqrt(B * mach_squared_minus_one)) \
+        - np.arctan(np.sqrt(mach_squared_minus_one))
+
+    return prandtl_meyer_angle
+
+
+def prandtl_meyer_function_from_angle_vec(prandtl_meyer_angle, gamma):
+    r"""Calculates the Mach numbers for an array of Prandtl-Meyer angles
+
+    The Prandtl-Meyer function is tabulated once per gamma for Mach numbers
+    between 1 and 50 (clustered near M = 1, where it is steepest) and
+    inverted by linear interpolation. The relative error of the Mach number
+    is below about 1.2e-6 (5e-7 at M = 9), whereas
+    :func:`prandtl_meyer_function_from_angle` converges to round-off.
+
+    Args:
+        prandtl_meyer_angle (numpy.array): Prandtl meyer angles in degree
+        gamma: Heat capacity ratio
+
+    Returns:
+        Mach numbers
+
+    """
+    mach_table, prandtl_meyer_angle_table = _prandtl_meyer_table(gamma)
+    prandtl_meyer_angle_radians = np.radians(prandtl_meyer_angle)
+    if np.any(prandtl_meyer_angle_radians < 0) or np.any(
+            prandtl_meyer_angle_radians > prandtl_meyer_angle_table[-1]):
+        raise ValueError("Prandtl-Meyer angle outside of 1 <= M <= 50")
+
+    mach = np.interp(prandtl_meyer_angle_radians, prandtl_meyer_angle_table,
+                     mach_table)
+
+    return mach
+
+
+@functools.lru_cache(maxsize=16)
+def _prandtl_meyer_table(gamma):
+    # Lookup table of prandtl_meyer_function_from_angle_vec, shared between
+    # calls and therefore read-only
+    N_MACH = 10000
+    mach_table = np.concatenate(([1.0], 1 + np.geomspace(1e-8, 49, N_MACH)))
+    prandtl_meyer_angle_table = prandtl_meyer_function_from_mach_vec(
+                                    mach_table, gamma)
+    mach_table.setflags(write=False)
+    prandtl_meyer_angle_table.setflags(write=False)
+
+    return mach_table, prandtl_meyer_angle_table
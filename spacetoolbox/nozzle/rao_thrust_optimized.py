@@ -1,11 +1,13 @@
+import functools
 import math
 import numpy as np
-import pandas as pd
-import matplotlib as mpl
-import matplotlib.pyplot as plt
+
+_DEG2RAD = math.pi / 180.0
+_TAN_15 = math.tan(15 * _DEG2RAD)
 
 def calculate_parabolic(radius_throat, area_ratio, theta_i, 
-                        theta_exit, percent_length_conical):
+                        theta_exit, percent_length_conical, write_csv=False,
+                        write_png=False, dtype=np.float64):
     r"""
     Calculates a bell nozzle according to Rao thrust-optimized parabolic
     approach. Rao applied the Method of characteristics to determine bell 
@@ -46,10 +48,11 @@ def calculate_parabolic(radius_throat, area_ratio, theta_i,
             y_{fc} &=& sin(\theta_{fc})\cdot 1.5 \cdot r_t + (1.5 \cdot r_t + r_t)
         \end{eqnarray}
 
-    Both equations are solved at a number of different angles :math:`{\theta}_{fc}` 
-    that are determined with the help of a defined step size. Decreasing the
-    step size increases the number of points in each curve. The second divergent
-    curve (sc) is defined as:
+    Both equations are solved at 301 equally spaced angles
+    :math:`{\theta}_{fc}` from -135° to -90°. The second divergent curve (sc)
+    is sampled the same way, at 301 equally spaced angles
+    :math:`{\theta}_{sc}` from -90° to :math:`{\theta}_i - 90°`, and is
+    defined as:
 
     .. math::
         \begin{eqnarray}
@@ -65,28 +68,26 @@ def calculate_parabolic(radius_throat, area_ratio, theta_i,
             y_{tc} &=& \sqrt{\varepsilon}r_t
         \end{eqnarray}
 
-    The coefficients of the parabolic equations are solved by a matrix equation.
-    To solve the equation, the coordinates of the endpoints (ep) of the second
-    and third curve are needed.
+    The coefficients of the parabolic equation follow from the endpoints (ep)
+    of the second and third curve and the slope at the end of the second
+    curve:
+
+    .. math::
+        \begin{eqnarray}
+            a y_{sc,ep}^2 + b y_{sc,ep} + c &=& x_{sc,ep} \\
+            a y_{tc,ep}^2 + b y_{tc,ep} + c &=& x_{tc,ep} \\
+            2 a y_{sc,ep} + b &=& 1 / tan(\theta_i)
+        \end{eqnarray}
+
+    This system is solved in closed form:
 
     .. math::
-        \begin{bmatrix}
-            y_{sc,ep}^2 & y_{sc,ep} & 1 \\ 
-            y_{tc,ep}^2 & y_{tc,ep} & 1 \\ 
-            2y_{sc,ep} & 1 & 0
-        \end{bmatrix}^{-1} 
-        \cdot
-        \begin{bmatrix}
-            x_{sc,ep}\\
-            x_{tc,ep}\\
-            1 / tan(\theta_i)
-        \end{bmatrix}^{-1}     
-        =  
-        \begin{bmatrix}
-            a\\
-            b\\
-            c
-        \end{bmatrix}^{-1}    
+        \begin{eqnarray}
+            a &=& \frac{(x_{tc,ep} - x_{sc,ep}) - (y_{tc,ep} - y_{sc,ep})
+                  / tan(\theta_i)}{(y_{tc,ep} - y_{sc,ep})^2} \\
+            b &=& 1 / tan(\theta_i) - 2 a y_{sc,ep} \\
+            c &=& x_{sc,ep} - a y_{sc,ep}^2 - b y_{sc,ep}
+        \end{eqnarray}
 
     Args:
         radius_throat (float): throat radius :math:`r_t`
@@ -99,75 +100,114 @@ def calculate_parabolic(radius_throat, area_ratio, theta_i,
             nozzle e.g. a 80% bell nozzle has a length that is 20% shorter 
             than a comparable 15° cone half angle nozzle of the same area 
             ratio (see Fig. 1)
+        write_csv (bool): export the contour with :func:`export_parabolic`
+        write_png (bool): plot the contour with :func:`plot_parabolic`
+        dtype (numpy.dtype): floating point type of the returned
+            coordinates, e.g. numpy.float32 for CAD export where single
+            precision is enough
             
     Returns:
-        CSV-File and Graph containing the nozzle x and y coordinates
+        Dictionary with the nozzle x and y coordinates ("x", "y") and the
+        nozzle length ("length"). Results are cached per input, so the
+        coordinate arrays are read-only; copy them before modifying.
 
     """
 
-    # First curve (fc)
-    length_nozzle = percent_length_conical * (math.sqrt(area_ratio) - 1) \
-                    * radius_throat / math.tan(15 * math.pi / 180)
+    dtype = np.dtype(dtype)
+    if not np.issubdtype(dtype, np.floating):
+        raise ValueError("dtype must be a floating point type, got "
+                         + str(dtype))
 
-    angle_fc =  -(math.pi + (45 * math.pi / 180))
-    N_STEPS_FC = 300
-    step_fc = (-math.pi / 2 - angle_fc) / N_STEPS_FC
-    theta_fc = np.arange(-3 / 4 * math.pi, -math.pi / 2 + 0.001, step_fc)
+    (x_nozzle, y_nozzle, length_nozzle, x_sc_endpoint, y_sc_endpoint,
+     y_exit) = _parabolic_contour(radius_throat, area_ratio, theta_i,
+                                  percent_length_conical, dtype)
 
-    x_fc = np.cos(theta_fc) * 1.5 * radius_throat
-    y_fc = np.sin(theta_fc) * 1.5 * radius_throat + (1.5 * radius_throat
-           + radius_throat)
+    if write_csv:
+        export_parabolic(x_nozzle, y_nozzle)
 
-    # np.savetxt('firstCurve.csv', (x_fc, y_fc), delimiter=";")
+    if write_png:
+        plot_parabolic(x_nozzle, y_nozzle, radius_throat, theta_i, theta_exit,
+                       x_sc_endpoint, y_sc_endpoint, y_exit, length_nozzle)
 
-    # Second curve (sc)
-    angle_sc = -math.pi / 2
-    N_STEPS_SC = 300
-    step_sc = theta_i / N_STEPS_SC
-    theta_sc = np.arange(angle_sc, theta_i - math.pi / 2 + step_sc, step_sc)
+    return {"x": x_nozzle, "y": y_nozzle, "length": length_nozzle}
 
-    x_sc = np.cos(theta_sc) * 0.382 * radius_throat
-    y_sc = np.sin(theta_sc) * 0.382 * radius_throat + (0.382 * radius_throat
-           + radius_throat)
 
-    # np.savetxt('secondCurve.csv', (x_sc, y_sc), delimiter=";")
+@functools.lru_cache(maxsize=128)
+def _parabolic_contour(radius_throat, area_ratio, theta_i,
+                       percent_length_conical, dtype):
+    # Geometry part of calculate_parabolic, cached for repeated identical
+    # calls (e.g. optimizers re-evaluating a baseline). The returned arrays
+    # are shared between calls and therefore read-only.
+    length_nozzle = percent_length_conical * (math.sqrt(area_ratio) - 1) \
+                    * radius_throat / _TAN_15
 
-    # Third curve (tc)
-    x_sc_endpoint = math.cos(theta_i - math.pi / 2) * 0.382 * radius_throat
-    y_sc_endpoint = math.sin(theta_i - math.pi / 2) * 0.382 * radius_throat \
-           + (0.382 * radius_throat + radius_throat)
+    # Sampling of the three curves
+    N_STEPS_FC = 300
+    theta_fc = np.linspace(-0.75 * math.pi, -0.5 * math.pi, N_STEPS_FC + 1)
 
-    y_exit = math.sqrt(area_ratio) * radius_throat
+    N_STEPS_SC = 300
+    theta_sc = np.linspace(-0.5 * math.pi, theta_i - 0.5 * math.pi,
+                           N_STEPS_SC + 1)
 
-    matrix_y = np.array([[y_sc_endpoint ** 2, y_sc_endpoint, 1], 
-                         [y_exit ** 2, y_exit, 1],
-                         [2 * y_sc_endpoint, 1, 0]])
-    matrix_x = np.array([x_sc_endpoint, length_nozzle, 1 / math.tan(theta_i)])
-    inverse_matrix_y = np.linalg.inv(matrix_y)
-    parabola_coefficients = inverse_matrix_y.dot(matrix_x) 
+    # cos(theta_i - pi/2) = sin(theta_i), sin(theta_i - pi/2) = -cos(theta_i)
+    sin_theta_i = math.sin(theta_i)
+    cos_theta_i = math.cos(theta_i)
+    x_sc_endpoint = sin_theta_i * 0.382 * radius_throat
+    y_sc_endpoint = (1 - cos_theta_i) * 0.382 * radius_throat + radius_throat
 
-    coefficient_a = parabola_coefficients[0]
-    coefficient_b = parabola_coefficients[1]
-    coefficient_c = parabola_coefficients[2]
+    y_exit = math.sqrt(area_ratio) * radius_throat
 
     STEPSIZE_Y_TC = 0.001
-    y_tc = np.arange(y_sc_endpoint, y_exit + STEPSIZE_Y_TC, STEPSIZE_Y_TC)
-    x_tc = coefficient_a * y_tc**2 + coefficient_b * y_tc + coefficient_c
+    N_STEPS_TC = int(math.ceil((y_exit - y_sc_endpoint) / STEPSIZE_Y_TC))
+    y_tc = np.linspace(y_sc_endpoint, y_exit, N_STEPS_TC + 1)
 
-    # np.savetxt('thirdCurve.csv', (x_tc, y_tc), delimiter=";")
+    # Every curve is written directly into its slice of the contour
+    n_fc = N_STEPS_FC + 1
+    n_sc = N_STEPS_SC + 1
+    n_tc = N_STEPS_TC + 1
+    x_nozzle = np.empty(n_fc + n_sc + n_tc, dtype=dtype)
+    y_nozzle = np.empty_like(x_nozzle)
 
-    x_nozzle = np.concatenate((x_fc,x_sc, x_tc),axis=0)
-    y_nozzle = np.concatenate((y_fc,y_sc, y_tc),axis=0)
+    # First curve (fc)
+    x_fc = x_nozzle[:n_fc]
+    y_fc = y_nozzle[:n_fc]
+    np.cos(theta_fc, out=x_fc)
+    x_fc *= 1.5 * radius_throat
+    np.sin(theta_fc, out=y_fc)
+    y_fc *= 1.5 * radius_throat
+    y_fc += 1.5 * radius_throat + radius_throat
+
+    # Second curve (sc)
+    x_sc = x_nozzle[n_fc:n_fc + n_sc]
+    y_sc = y_nozzle[n_fc:n_fc + n_sc]
+    np.cos(theta_sc, out=x_sc)
+    x_sc *= 0.382 * radius_throat
+    np.sin(theta_sc, out=y_sc)
+    y_sc *= 0.382 * radius_throat
+    y_sc += 0.382 * radius_throat + radius_throat
 
-    np.savetxt('rao_thrust_optimized_parabola.csv',
-              (x_nozzle, y_nozzle), delimiter=";")
+    # Third curve (tc)
+    # Closed-form solution of the two endpoint and the slope conditions
+    slope_sc_endpoint = cos_theta_i / sin_theta_i
+    delta_y = y_exit - y_sc_endpoint
+    coefficient_a = ((length_nozzle - x_sc_endpoint) - slope_sc_endpoint
+                     * delta_y) / (delta_y * delta_y)
+    coefficient_b = slope_sc_endpoint - 2 * coefficient_a * y_sc_endpoint
+    coefficient_c = x_sc_endpoint - coefficient_a * y_sc_endpoint \
+                    * y_sc_endpoint - coefficient_b * y_sc_endpoint
 
-    export_parabolic(x_nozzle, y_nozzle)
+    x_tc = x_nozzle[n_fc + n_sc:]
+    y_nozzle[n_fc + n_sc:] = y_tc
+    np.multiply(y_tc, coefficient_a, out=x_tc)
+    x_tc += coefficient_b
+    x_tc *= y_tc
+    x_tc += coefficient_c
 
-    plot_parabolic(x_nozzle, y_nozzle, radius_throat, theta_i, theta_exit,
-                   x_sc_endpoint, y_sc_endpoint, y_exit, length_nozzle)
+    x_nozzle.setflags(write=False)
+    y_nozzle.setflags(write=False)
 
-    return length_nozzle
+    return (x_nozzle, y_nozzle, length_nozzle, x_sc_endpoint, y_sc_endpoint,
+            y_exit)
 
 
 # Add plot function
@@ -200,6 +240,8 @@ def plot_parabolic(x_nozzle, y_nozzle, radius_throat, theta_i, theta_exit,
         Exports a png nozzle of the rao parabolic nozzle geometry
 
     """
+    import matplotlib.pyplot as plt
+
     negative_y_nozzle = -1 * y_nozzle
     fig = plt.figure()
 
@@ -231,14 +273,14 @@ def plot_parabolic(x_nozzle, y_nozzle, radius_throat, theta_i, theta_exit,
     exit_radius_annotation = r'$r_e$ = ' + str(y_exit) + ' mm'
     plt.annotate(exit_radius_annotation, xy=(length_nozzle - 0.15, y_exit / 2),
                    ha='right')
-    theta_e_annotation =  r'$\theta_e$ = ' + str(round(theta_exit * 180 
-                          / math.pi, 1)) + '°'
+    theta_e_annotation =  r'$\theta_e$ = ' + str(round(theta_exit
+                          / _DEG2RAD, 1)) + '°'
     plt.annotate(theta_e_annotation, xy=(length_nozzle - 0.15, y_exit + 
                  0.15), ha='center')
     plt.plot(length_nozzle, y_exit, marker='o', markersize=3,
              color="red")
-    theta_i_annotation =  r'$\theta_i$ = ' + str(round(theta_i * 180 
-                          / math.pi, 1)) + '°'
+    theta_i_annotation =  r'$\theta_i$ = ' + str(round(theta_i
+                          / _DEG2RAD, 1)) + '°'
     plt.annotate(theta_i_annotation, xy=(x_sc_endpoint + 0.5, 
                  y_sc_endpoint), ha='left')
     plt.plot(x_sc_endpoint, y_sc_endpoint, marker='o', markersize=3,
@@ -248,7 +290,7 @@ def plot_parabolic(x_nozzle, y_nozzle, radius_throat, theta_i, theta_exit,
 
 
 # Add export
-def export_parabolic(x_nozzle, y_nozzle):
+def export_parabolic(x_nozzle, y_nozzle, output_format="csv", verbose=False):
     r"""Exports the Rao thrust optimized parabolic nozzle in the current directory
 
     Args:
@@ -256,28 +298,50 @@ def export_parabolic(x_nozzle, y_nozzle):
             (along nozzle axis)
         y_nozzle (numpy.array):  y-Coordinates of nozzle contour (radius of 
             nozzle)
+        output_format (string): "csv" for a text file or "npy" for a binary
+            NumPy file with one (x, y) row per point, which skips the text
+            formatting for high resolution contours
+        verbose (bool): print the exported coordinates to the console
             
     Returns:
-        CSV-Export of nozzle x and y coordinates
+        CSV- or NPY-Export of nozzle x and y coordinates
 
     """
-    df = pd.DataFrame({"x_nozzle" : x_nozzle, "y_nozzle" : y_nozzle})
-    print(df)
-    df.to_csv("rao_thrust_optimized_parabola.csv", index=False)
-
-    return df
-
-# Verification: Sutton Table 3-4 "Data on Several Bell-Shaped nozzles"
-# Case: 80% Bell contour, area ratio 10
-
-radius_throat = 1
-area_ratio = 25
-theta_exit = 8.5 * math.pi / 180
-theta_i = 30 * math.pi / 180
-percent_length_conical = 0.8
-
-print(calculate_parabolic(radius_throat, area_ratio, theta_i, 
-                                     theta_exit, 
-                                     percent_length_conical))
-
-
+    if output_format not in ("csv", "npy"):
+        raise ValueError("output_format must be 'csv' or 'npy', got "
+                         + repr(output_format))
+
+    nozzle_coordinates = np.column_stack((x_nozzle, y_nozzle))
+    if verbose:
+        print(nozzle_coordinates)
+
+    if output_format == "npy":
+        np.save("rao_thrust_optimized_parabola.npy", nozzle_coordinates)
+    elif output_format == "csv":
+        # Shortest format that still round-trips the coordinate precision,
+        # e.g. 9 digits for float32 and 17 digits for float64
+        if np.issubdtype(nozzle_coordinates.dtype, np.floating):
+            n_digits = math.ceil((np.finfo(nozzle_coordinates.dtype).nmant
+                                  + 1) * math.log10(2)) + 1
+        else:
+            n_digits = 17
+        np.savetxt("rao_thrust_optimized_parabola.csv", nozzle_coordinates,
+                   fmt="%." + str(n_digits) + "g", delimiter=",",
+                   header="x_nozzle,y_nozzle", comments="")
+
+    return nozzle_coordinates
+
+
+if __name__ == "__main__":
+    # Verification: Sutton Table 3-4 "Data on Several Bell-Shaped nozzles"
+    # Case: 80% Bell contour, area ratio 10
+
+    radius_throat = 1
+    area_ratio = 25
+    theta_exit = 8.5 * _DEG2RAD
+    theta_i = 30 * _DEG2RAD
+    percent_length_conical = 0.8
+
+    print(calculate_parabolic(radius_throat, area_ratio, theta_i,
+                              theta_exit, percent_length_conical,
+                              write_csv=True, write_png=True))
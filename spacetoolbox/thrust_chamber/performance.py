@@ -1,4 +1,5 @@
 import math
+import numpy as np
 
 def ideal_thrust_coefficient(gamma, pressure_total, area_ratio, pressure_exit, pressure_atmos):
     r"""Calculates the ideal thrust coefficient
@@ -27,3 +28,71 @@ def ideal_thrust_coefficient(gamma, pressure_total, area_ratio, pressure_exit, p
                                / pressure_total) * area_ratio
                                 
     return ideal_thrust_coefficient
+
+
+def make_ideal_thrust_coefficient(gamma):
+    r"""Returns the ideal thrust coefficient as a function of the pressures
+    and the area ratio for a fixed heat capacity ratio
+
+    The heat capacity ratio dependent terms of :func:`ideal_thrust_coefficient`
+    are evaluated once, so repeated evaluations (e.g. in optimizers or design
+    sweeps) only cost one power and one square root.
+
+    Args:
+        gamma (float): Heat capacity ratio
+
+    Returns:
+        Function ``(pressure_total, area_ratio, pressure_exit,
+        pressure_atmos)`` returning the ideal thrust coefficient
+
+    """
+    coefficient, exponent = _thrust_coefficient_constants(gamma)
+
+    def ideal_thrust_coefficient_gamma(pressure_total, area_ratio,
+                                       pressure_exit, pressure_atmos):
+        return math.sqrt(coefficient * (1 - (pressure_exit / pressure_total)
+                         ** exponent)) + ((pressure_exit - pressure_atmos)
+                         / pressure_total) * area_ratio
+
+    return ideal_thrust_coefficient_gamma
+
+
+def ideal_thrust_coefficient_vec(gamma, pressure_total, area_ratio,
+                                 pressure_exit, pressure_atmos):
+    r"""Calculates the ideal thrust coefficient for arrays of operating points
+
+    Same equation as :func:`ideal_thrust_coefficient`, evaluated with NumPy
+    so a whole batch (e.g. of a Monte-Carlo or optimizer run) is computed in
+    one pass. The heat capacity ratio dependent terms are evaluated once.
+
+    Args:
+        gamma (float): Heat capacity ratio
+        pressure_total (float or numpy.array): Total pressure (simplified:
+            chamber pressure)
+        area_ratio (float or numpy.array): Ratio of exit area to throat area
+        pressure_exit (float or numpy.array): Pressure at the end of the nozzle
+        pressure_atmos (float or numpy.array): Atmospheric pressure at Nozzle
+            exit
+
+    Returns:
+        Ideal thrust coefficients
+
+    """
+    coefficient, exponent = _thrust_coefficient_constants(gamma)
+    pressure_ratio = np.asarray(pressure_exit) / pressure_total
+    ideal_thrust_coefficient = np.sqrt(coefficient * (1 - pressure_ratio
+                               ** exponent)) + (pressure_ratio
+                               - np.asarray(pressure_atmos) / pressure_total) \
+                               * area_ratio
+
+    return ideal_thrust_coefficient
+
+
+def _thrust_coefficient_constants(gamma):
+    gamma_minus_one = gamma - 1
+    gamma_plus_one = gamma + 1
+    coefficient = 2 * gamma**2 / gamma_minus_one * (2 / gamma_plus_one) \
+                  ** (gamma_plus_one / gamma_minus_one)
+    exponent = gamma_minus_one / gamma
+
+    return coefficient, exponent